@@ -0,0 +1,17 @@
+"""Process-wide runtime tuning applied before Polars is imported.
+
+Imported for its side effect by the ``services`` package, ahead of any module
+that loads Polars: Polars reads ``POLARS_MAX_THREADS`` once, when it creates
+its thread pool on first import.
+"""
+
+import os
+
+# CPUs this process may run on (CPU affinity/cpuset), not the host's core count
+CPU_COUNT = (
+    len(os.sched_getaffinity(0))
+    if hasattr(os, "sched_getaffinity")
+    else os.cpu_count() or 1
+)
+
+os.environ.setdefault("POLARS_MAX_THREADS", str(CPU_COUNT))
@@ -1,4 +1,6 @@
-from pydantic import Field
+from functools import lru_cache
+
+from pydantic import Field, PrivateAttr, computed_field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -14,6 +16,8 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         extra="ignore",
+        # Validation errors must not echo secrets (API secret, URIs) into logs
+        hide_input_in_errors=True,
     )
 
     # Worker identification
@@ -47,9 +51,11 @@ class Settings(BaseSettings):
         default=10, description="Heartbeat interval in seconds"
     )
 
-    @property
-    def mongo_database(self) -> str:
-        """Extract database name from MongoDB URI."""
+    _mongo_database: str = PrivateAttr(default="")
+
+    @model_validator(mode="after")
+    def _parse_mongo_database(self) -> "Settings":
+        """Extract database name from MongoDB URI once, failing fast if missing."""
         # Parse database from URI like: mongodb://host:port/database or mongodb+srv://...
         if "/" in self.mongo_uri:
             parts = self.mongo_uri.rstrip("/").split("/")
@@ -57,19 +63,20 @@ class Settings(BaseSettings):
                 # Remove query params if any
                 db_part = parts[-1].split("?")[0]
                 if db_part:
-                    return db_part
+                    self._mongo_database = db_part
+                    return self
         raise ValueError(
             "Cannot extract database name from mongo_uri. Please include database in the URI."
         )
 
-
-# Global settings instance
-settings: Settings | None = None
+    @computed_field
+    @property
+    def mongo_database(self) -> str:
+        """Database name parsed from ``mongo_uri`` at construction."""
+        return self._mongo_database
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get or create the global settings instance."""
-    global settings
-    if settings is None:
-        settings = Settings()
-    return settings
+    """Get or create the cached settings instance."""
+    return Settings()
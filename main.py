@@ -1,10 +1,11 @@
+import atexit
 import time
 import traceback
 
 from config.settings import get_settings
 from services.api import make_api_client
-from services.db import ProcessingState
-from services.jobs import get_next_job, process_job, start_heartbeat
+from services.db import ProcessingState, close_mongo_client
+from services.jobs import HeartbeatManager, get_next_job, process_job
 
 
 def log(msg: str):
@@ -14,17 +15,24 @@ def log(msg: str):
 def main():
     settings = get_settings()
     client = make_api_client(settings)
+    atexit.register(close_mongo_client, settings.mongo_uri)
 
     log(f"Worker ID: {settings.worker_id}")
 
     max_empty_retries = 2
+    # Tiempo de espera por reintento vacío; lo que el servidor ya esperó en el
+    # long-poll se descuenta, así un backend sin long-poll sigue esperando 60s
     sleep_seconds = 60
+    min_sleep_seconds = 2
     empty_retries = 0
-    hb_thread = None
-    stop_event = None
+
+    # Un único hilo de heartbeat reutilizado entre jobs
+    heartbeat = HeartbeatManager(client, settings.heartbeat_interval, log)
+    heartbeat.start()
 
     try:
         while True:
+            poll_started = time.monotonic()
             next_job = get_next_job(client, log)
 
             if next_job:
@@ -34,21 +42,13 @@ def main():
                 processing_state = ProcessingState()
 
                 # Inicia heartbeat para este job específico
-                hb_thread, stop_event = start_heartbeat(
-                    client,
-                    next_job.id,
-                    settings.heartbeat_interval,
-                    log,
-                    processing_state,
-                )
-
-                # Procesa el job
-                process_job(next_job, settings, client, log, processing_state)
-
-                # ✅ DETIENE el heartbeat después de terminar
-                stop_event.set()
-                hb_thread.join(timeout=5)
-                hb_thread, stop_event = None, None  # Reset para el siguiente job
+                heartbeat.set_job(next_job.id, processing_state)
+                try:
+                    # Procesa el job
+                    process_job(next_job, settings, client, log, processing_state)
+                finally:
+                    # ✅ Deja de reportar este job al terminar (o si falló)
+                    heartbeat.clear_job()
 
                 continue
 
@@ -57,18 +57,19 @@ def main():
                 log("No job available after retries. Exiting.")
                 return
 
+            polled_seconds = time.monotonic() - poll_started
+            wait_seconds = max(min_sleep_seconds, sleep_seconds - polled_seconds)
             log(
-                f"No job available. Retry {empty_retries}/{max_empty_retries} after {sleep_seconds}s."
+                f"No job available. Retry {empty_retries}/{max_empty_retries} after {wait_seconds:.0f}s."
             )
-            time.sleep(sleep_seconds)
+            time.sleep(wait_seconds)
 
     except Exception as e:
         log(f"Unhandled error: {e}\n{traceback.format_exc()}")
-        # ✅ Detiene el heartbeat si hubo error durante el job
-        if hb_thread:
-            stop_event.set()
-            hb_thread.join(timeout=5)
         raise e
+    finally:
+        heartbeat.stop()
+        client.close()
 
 
 if __name__ == "__main__":
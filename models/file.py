@@ -7,19 +7,26 @@ class ChunkStream(io.RawIOBase):
     def __init__(self, chunk_iter):
         super().__init__()
         self._chunks = iter(chunk_iter)
-        self._buffer = b""
+        # Zero-copy cursor over the current chunk
+        self._mv: memoryview | None = None
+        self._pos = 0
 
     def readable(self):
         return True
 
     def readinto(self, b):
         try:
-            while len(self._buffer) == 0:
-                self._buffer = next(self._chunks)
+            while self._mv is None or self._pos >= len(self._mv):
+                if self._mv is not None:
+                    # Release the exhausted chunk so its buffer can be freed
+                    self._mv.release()
+                    self._mv = None
+                self._mv = memoryview(next(self._chunks))
+                self._pos = 0
         except StopIteration:
             return 0  # EOF
 
-        n = min(len(b), len(self._buffer))
-        b[:n] = self._buffer[:n]
-        self._buffer = self._buffer[n:]
+        n = min(len(b), len(self._mv) - self._pos)
+        b[:n] = self._mv[self._pos : self._pos + n]
+        self._pos += n
         return n
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class JobConfig(BaseModel):
@@ -16,6 +16,8 @@ class JobConfig(BaseModel):
         type_head: Header type - "auto", "file_parse", "file_fixed" (legacy compatibility)
     """
 
+    model_config = ConfigDict(extra="ignore", frozen=True, populate_by_name=True)
+
     delimitador: str | None = Field(None, description="CSV delimiter/separator")
     size: str | None = Field(None, description="Batch/chunk size for processing")
     campos: list[str] | None = Field(None, description="Column names to apply")
@@ -34,6 +36,8 @@ class JobConfig(BaseModel):
 
 
 class JobResponse(BaseModel):
+    model_config = ConfigDict(extra="ignore", frozen=True, populate_by_name=True)
+
     id: str
     file_path: str
     collection_name: str
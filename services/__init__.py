@@ -0,0 +1,7 @@
+"""Worker services: backend API, blob storage, jobs and Mongo loading.
+
+Importing the package applies :mod:`config.runtime` first, so the Polars
+thread-pool cap holds for any entrypoint that uses these services.
+"""
+
+import config.runtime  # noqa: F401
@@ -1,6 +1,6 @@
 """Simple API client with base URL and default headers.
 
-Provides a small wrapper around `requests.Session` so you can do:
+Provides a small wrapper around an HTTP/2 `httpx.Client` so you can do:
 
         client = make_api_client()
         client.get("/jobs/123")
@@ -9,16 +9,26 @@ It automatically applies:
  - Base URL from settings
  - Default headers with API secret and worker signature
  - Sensible timeout defaults
+ - A single pooled keep-alive connection shared by heartbeats and job calls
 """
 
 from __future__ import annotations
 
+import time
 from typing import Any, Mapping
 
-import requests
+import httpx
 
 from config.settings import get_settings, Settings
 
+# Gateway errors retried by ApiClient.request, with exponential backoff.
+# Only idempotent methods are retried (as urllib3's Retry did): a POST such as
+# a heartbeat may already have been applied when the gateway times out.
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_RETRY_METHODS = frozenset({"GET", "PUT", "DELETE", "HEAD", "OPTIONS"})
+_MAX_STATUS_RETRIES = 2
+_RETRY_BACKOFF_SECONDS = 0.5
+
 
 class ApiClient:
     """Minimal API client with default headers and base URL."""
@@ -29,11 +39,10 @@ class ApiClient:
         api_secret: str,
         worker_id: str,
         *,
-        session: requests.Session | None = None,
+        client: httpx.Client | None = None,
         default_timeout: float | int = 20,
     ) -> None:
         self.base_url = base_url.rstrip("/")
-        self.session = session or requests.Session()
         self.default_timeout = default_timeout
         # Default headers include an authentication secret and a worker signature
         self.default_headers: dict[str, str] = {
@@ -42,11 +51,25 @@ class ApiClient:
             "X-Client-Signature": f"csv-worker/{worker_id}",
             "Accept": "application/json",
         }
+        # Base URL and default headers live on the client, so requests only
+        # carry per-call overrides. HTTP/2 multiplexes calls over one connection.
+        # Transport retries cover connection errors; statuses are retried below.
+        self.client = client or httpx.Client(
+            timeout=default_timeout,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=2,
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+            ),
+        )
+        # Applied to injected clients too, matching the old requests.Session
+        self.client.base_url = self.base_url
+        self.client.headers.update(self.default_headers)
+        self.client.follow_redirects = True
 
-    def _full_url(self, path: str) -> str:
-        if path.startswith("http://") or path.startswith("https://"):
-            return path
-        return f"{self.base_url}/{path.lstrip('/')}"
+    def close(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        self.client.close()
 
     def request(
         self,
@@ -58,33 +81,45 @@ class ApiClient:
         data: Any | None = None,
         headers: Mapping[str, str] | None = None,
         timeout: float | int | None = None,
-    ) -> requests.Response:
-        req_headers = {**self.default_headers, **(headers or {})}
-        resp = self.session.request(
-            method=method,
-            url=self._full_url(path),
-            params=params,
-            json=json,
-            data=data,
-            headers=req_headers,
-            timeout=timeout or self.default_timeout,
+        raise_for_status: bool = True,
+        retry: bool = True,
+    ) -> httpx.Response:
+        retries = (
+            _MAX_STATUS_RETRIES if retry and method.upper() in _RETRY_METHODS else 0
         )
-        resp.raise_for_status()
+        # Client already carries base URL and default_headers
+        for attempt in range(retries + 1):
+            resp = self.client.request(
+                method=method,
+                url=path,
+                params=params,
+                json=json,
+                data=data,
+                headers=headers,
+                timeout=timeout or self.default_timeout,
+            )
+            if resp.status_code not in _RETRY_STATUSES:
+                break
+            if attempt < retries:
+                time.sleep(_RETRY_BACKOFF_SECONDS * 2**attempt)
+        # Callers that inspect status_code themselves can skip the check
+        if raise_for_status:
+            resp.raise_for_status()
         return resp
 
-    def get(self, path: str, **kwargs: Any) -> requests.Response:
+    def get(self, path: str, **kwargs: Any) -> httpx.Response:
         return self.request("GET", path, **kwargs)
 
-    def post(self, path: str, **kwargs: Any) -> requests.Response:
+    def post(self, path: str, **kwargs: Any) -> httpx.Response:
         return self.request("POST", path, **kwargs)
 
-    def put(self, path: str, **kwargs: Any) -> requests.Response:
+    def put(self, path: str, **kwargs: Any) -> httpx.Response:
         return self.request("PUT", path, **kwargs)
 
-    def patch(self, path: str, **kwargs: Any) -> requests.Response:
+    def patch(self, path: str, **kwargs: Any) -> httpx.Response:
         return self.request("PATCH", path, **kwargs)
 
-    def delete(self, path: str, **kwargs: Any) -> requests.Response:
+    def delete(self, path: str, **kwargs: Any) -> httpx.Response:
         return self.request("DELETE", path, **kwargs)
 
 
@@ -1,14 +1,51 @@
+from functools import lru_cache, partial
+from itertools import chain, repeat
 from typing import Callable
+import io
+import queue
 import threading
 
+import bson
 import polars as pl
+import pyarrow as pa
+import pyarrow.csv as pacsv
+from bson.raw_bson import RawBSONDocument
 from pymongo import MongoClient
 
+from config.runtime import CPU_COUNT
+from models.file import ChunkStream
 from models.jobs import JobConfig
 
+# The CSV parser runs on Arrow's pool, so cap it the same way
+pa.set_cpu_count(CPU_COUNT)
+
 Logger = Callable[[str], None]
 
 
+@lru_cache(maxsize=1)
+def _get_mongo_client(uri: str) -> MongoClient:
+    """Return a pooled MongoClient shared by every job in this worker.
+
+    Uses w=1 without journaling plus wire compression: the worker only appends
+    raw rows, so we trade durability of the last batch for throughput.
+    """
+    return MongoClient(
+        uri,
+        maxPoolSize=16,
+        retryWrites=True,
+        w=1,
+        journal=False,
+        compressors="zstd,snappy",
+    )
+
+
+def close_mongo_client(uri: str) -> None:
+    """Close the shared MongoClient, if one was created, and drop it from cache."""
+    if _get_mongo_client.cache_info().currsize:
+        _get_mongo_client(uri).close()
+    _get_mongo_client.cache_clear()
+
+
 class ProcessingState:
     """Thread-safe container for tracking processed rows during CSV streaming."""
 
@@ -29,6 +66,80 @@ class ProcessingState:
             return delta
 
 
+class _MongoBatchWriter:
+    """Background thread that inserts document batches into Mongo.
+
+    Decouples CSV parsing (CPU) from Mongo inserts (network) through a bounded
+    queue so both can run concurrently. The first insert error is stored and
+    re-raised in the producer thread; later batches are drained and dropped.
+    """
+
+    _SENTINEL = None
+
+    def __init__(
+        self,
+        collection,
+        log: Logger | None = None,
+        processing_state: ProcessingState | None = None,
+        max_pending: int = 4,
+    ):
+        self.collection = collection
+        self.log = log
+        self.processing_state = processing_state
+        self.total_rows = 0
+        self.error: Exception | None = None
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def put(self, chunk_number: int, docs: list[dict]) -> None:
+        """Queue a batch for insertion, blocking while the queue is full."""
+        self.raise_if_failed()
+        self._queue.put((chunk_number, docs))
+
+    def stop(self) -> None:
+        """Signal end of input and wait for pending batches (idempotent)."""
+        if not self._stopped:
+            self._stopped = True
+            self._queue.put(self._SENTINEL)
+        self._thread.join()
+
+    def raise_if_failed(self) -> None:
+        if self.error is not None:
+            raise self.error
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is self._SENTINEL:
+                return
+            if self.error is not None:
+                continue  # Drain so the producer never blocks on a dead writer
+
+            chunk_number, docs = item
+            try:
+                self._insert(chunk_number, docs)
+            except Exception as e:
+                self.error = e
+
+    def _insert(self, chunk_number: int, docs: list[dict]) -> None:
+        rows_in_batch = len(docs)
+        self.collection.insert_many(
+            _encode_docs(docs), ordered=False, bypass_document_validation=True
+        )
+        self.total_rows += rows_in_batch
+
+        # Update shared processing state if provided
+        if self.processing_state:
+            self.processing_state.add_rows(rows_in_batch)
+
+        if self.log and (chunk_number % 10 == 0 or chunk_number == 1):
+            self.log(
+                f"Chunk {chunk_number}: inserted {rows_in_batch} rows (total: {self.total_rows})"
+            )
+
+
 def process_csv_stream_to_mongo(
     stream_obj,
     mongo_uri: str,
@@ -44,7 +155,8 @@ def process_csv_stream_to_mongo(
 ):
     """Read CSV in streaming record batches and insert into Mongo in batches.
 
-    Uses Polars for efficient CSV parsing with full configuration support:
+    Uses PyArrow's streaming CSV reader (multi-threaded, ``block_size_bytes``
+    per block) with full configuration support:
     - Custom delimiters, encodings, column names, and data types
     - Skip rows functionality
     - Encoding error handling
@@ -52,8 +164,10 @@ def process_csv_stream_to_mongo(
 
     Optionally adds client_id (as 'ctr') and period (as 'crx') to each document.
     """
-    client = MongoClient(mongo_uri)
-    collection = client[mongo_db][mongo_collection]
+    # Shared across jobs so sockets are reused; closed at worker exit
+    client = _get_mongo_client(mongo_uri)
+    # Write concern (w=1, unjournaled) comes from the client
+    collection = client[mongo_db].get_collection(mongo_collection)
 
     # Parse configuration
     delimiter = config.delimitador if config and config.delimitador else ","
@@ -71,74 +185,123 @@ def process_csv_stream_to_mongo(
             if log:
                 log(f"Invalid size '{config.size}', using default {batch_size}")
 
-    # Build Polars schema from reglas (rules)
-    schema_overrides = None
+    # Arrow column types from reglas (rules), applied over the inferred schema
+    rule_types = {}
     if config and config.reglas:
-        schema_overrides = _convert_pandas_dtypes_to_polars(config.reglas)
-        if log and schema_overrides:
-            log(f"Applied schema overrides: {list(schema_overrides.keys())}")
+        rule_types = _convert_pandas_dtypes_to_arrow(config.reglas)
 
-    # Configure Polars reader
+    # Configure Arrow reader
     has_header = skip_rows == 0 and column_names is None
+    autogenerate_names = not has_header and column_names is None
+    strict = encoding_errors == "strict"
+
+    read_options = pacsv.ReadOptions(
+        block_size=block_size_bytes,
+        use_threads=True,
+        column_names=column_names,
+        autogenerate_column_names=autogenerate_names,
+        skip_rows=skip_rows,
+        encoding=encoding,
+    )
+    parse_options = pacsv.ParseOptions(
+        delimiter=delimiter,
+        invalid_row_handler=None if strict else lambda row: "skip",
+    )
+
+    writer = _MongoBatchWriter(collection, log, processing_state)
 
     try:
-        # Read CSV with Polars in batches
-        df_reader = pl.read_csv_batched(
-            stream_obj,
-            separator=delimiter,
-            has_header=has_header,
-            new_columns=column_names,
-            skip_rows=skip_rows,
-            encoding=encoding,
-            ignore_errors=(encoding_errors != "strict"),
-            schema_overrides=schema_overrides,
-            infer_schema_length=10000,
-            batch_size=chunk_size,
-            low_memory=False,
+        # Infer the schema once from the first block, then replay that block
+        # ahead of the rest of the stream for the actual read
+        buffered = io.BufferedReader(stream_obj)
+        head = buffered.read(block_size_bytes)
+        column_types = _infer_column_types(
+            head, len(head) < block_size_bytes, read_options, parse_options
+        )
+        applied_rules = _match_rule_types(
+            rule_types, column_types, autogenerate_names
+        )
+        column_types.update(applied_rules.values())
+        if log and applied_rules:
+            log(f"Applied schema overrides: {list(applied_rules.keys())}")
+
+        # Lenient mode reads text and casts in Polars, nulling bad values
+        cast_exprs = []
+        if not strict:
+            target_schema = pl.from_arrow(
+                pa.schema(list(column_types.items())).empty_table()
+            ).schema
+            cast_exprs = [
+                _lenient_cast(name, dtype)
+                for name, dtype in target_schema.items()
+                if dtype != pl.Utf8
+            ]
+            column_types = {name: pa.utf8() for name in column_types}
+
+        replay = ChunkStream(
+            chain([head], iter(partial(buffered.read, block_size_bytes), b""))
+        )
+
+        # Read CSV with Arrow in record batches of ~block_size_bytes
+        reader = pacsv.open_csv(
+            pa.input_stream(replay),
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=_convert_options(column_types),
         )
 
-        total_rows = 0
+        # Keep Polars-style names for headerless files (Arrow generates f0, f1, ...)
+        generated_names = None
+        if autogenerate_names:
+            generated_names = [
+                f"column_{i + 1}" for i in range(len(reader.schema.names))
+            ]
+
+        # Build metadata literals once per job, applied to every batch
+        meta_exprs = []
+        if client_id is not None:
+            meta_exprs.append(pl.lit(client_id, dtype=pl.Int64).alias("ctr"))
+        if period is not None:
+            # Convert period to int if it's numeric, once per job, typed explicitly
+            try:
+                period_value, period_dtype = int(period), pl.Int64
+            except (ValueError, TypeError):
+                period_value, period_dtype = period, pl.Utf8
+            meta_exprs.append(pl.lit(period_value, dtype=period_dtype).alias("crx"))
+
         chunk_number = 0
+        keys: tuple[str, ...] | None = None  # Document keys, shared by all batches
 
-        # Process each batch
-        batches = df_reader.next_batches(10)  # Get up to 10 batches at a time
-        while batches:
-            for df in batches:
+        # Process each record batch, split into chunk_size-row slices
+        for record_batch in reader:
+            for offset in range(0, record_batch.num_rows, chunk_size):
                 chunk_number += 1
 
+                # Zero-copy view of the Arrow slice
+                df = pl.from_arrow(record_batch.slice(offset, chunk_size))
+                if cast_exprs:
+                    df = df.with_columns(cast_exprs)
+                if generated_names:
+                    df.columns = generated_names
+
                 # Add metadata fields
-                if client_id is not None:
-                    df = df.with_columns(pl.lit(client_id).alias("ctr"))
-                if period is not None:
-                    # Convert period to int if it's numeric
-                    try:
-                        period_value = int(period)
-                    except (ValueError, TypeError):
-                        period_value = period
-                    df = df.with_columns(pl.lit(period_value).alias("crx"))
-
-                # Convert to dictionaries and insert
-                docs = df.to_dicts()
-                rows_in_batch = len(docs)
+                if meta_exprs:
+                    df = df.with_columns(meta_exprs)
 
+                # Convert to dictionaries and hand off to the writer thread
+                if keys is None:
+                    keys = tuple(df.columns)
+                docs = _frame_to_docs(df, keys)
                 if docs:
-                    collection.bulk_write(docs, ordered=False)
-                    total_rows += rows_in_batch
-
-                    # Update shared processing state if provided
-                    if processing_state:
-                        processing_state.add_rows(rows_in_batch)
+                    writer.put(chunk_number, docs)
 
-                    if log and (chunk_number % 10 == 0 or chunk_number == 1):
-                        log(
-                            f"Chunk {chunk_number}: inserted {rows_in_batch} rows (total: {total_rows})"
-                        )
-
-            batches = df_reader.next_batches(10)
+        # Wait for pending inserts and surface any writer failure
+        writer.stop()
+        writer.raise_if_failed()
 
         if log:
             log(
-                f"✓ Completed: {total_rows} total rows inserted in {chunk_number} chunks"
+                f"✓ Completed: {writer.total_rows} total rows inserted in {chunk_number} chunks"
             )
 
     except Exception as e:
@@ -146,51 +309,161 @@ def process_csv_stream_to_mongo(
             log(f"Error during CSV processing: {str(e)}")
         raise Exception(f"Error during CSV processing: {str(e)}")
     finally:
-        client.close()
+        writer.stop()
 
 
-def _convert_pandas_dtypes_to_polars(
-    pandas_dtypes: dict[str, str],
-) -> dict[str, pl.DataType]:
-    """Convert pandas dtype strings to Polars data types.
-
-    Handles common pandas dtype specifications:
-    - 'str', 'object' -> pl.Utf8
-    - 'int', 'int64', 'Int64' -> pl.Int64
-    - 'int32', 'Int32' -> pl.Int32
-    - 'float', 'float64' -> pl.Float64
-    - 'float32' -> pl.Float32
-    - 'bool' -> pl.Boolean
-    - 'datetime64[ns]' -> pl.Datetime
+def _frame_to_docs(df: pl.DataFrame, keys: tuple[str, ...]) -> list[dict]:
+    """Build Mongo documents from a DataFrame column-wise.
+
+    Each column is converted to a Python list in one call and rows are
+    assembled as ``dict(zip(keys, row))`` entirely through C builtins
+    (``map``/``zip``/``dict``), reusing the same ``keys`` tuple for every row.
+    This avoids the per-row overhead of ``DataFrame.to_dicts``.
     """
-    type_mapping = {
-        "str": pl.Utf8,
-        "string": pl.Utf8,
-        "object": pl.Utf8,
-        "int": pl.Int64,
-        "int64": pl.Int64,
-        "Int64": pl.Int64,
-        "int32": pl.Int32,
-        "Int32": pl.Int32,
-        "int16": pl.Int16,
-        "Int16": pl.Int16,
-        "int8": pl.Int8,
-        "Int8": pl.Int8,
-        "float": pl.Float64,
-        "float64": pl.Float64,
-        "float32": pl.Float32,
-        "bool": pl.Boolean,
-        "boolean": pl.Boolean,
-        "datetime64": pl.Datetime("ms"),
-        "datetime64[ns]": pl.Datetime("ns"),
-    }
+    cols = [df.get_column(c).to_list() for c in keys]
+    return list(map(dict, map(zip, repeat(keys), zip(*cols))))
+
 
-    result = {}
-    for col, dtype_str in pandas_dtypes.items():
-        dtype_str_lower = dtype_str.lower().strip()
-        if dtype_str_lower in type_mapping:
-            result[col] = type_mapping[dtype_str_lower]
-        elif dtype_str in type_mapping:
-            result[col] = type_mapping[dtype_str]
+def _convert_options(
+    column_types: dict[str, pa.DataType] | None = None,
+) -> pacsv.ConvertOptions:
+    """Arrow conversion options matching Polars' CSV null handling.
 
-    return result
+    Only empty fields are null (Arrow's default also treats "NA", "null", ...
+    as null), and empty strings become None instead of ``''``.
+    """
+    return pacsv.ConvertOptions(
+        column_types=column_types,
+        null_values=[""],
+        strings_can_be_null=True,
+    )
+
+
+def _infer_column_types(
+    head: bytes,
+    at_eof: bool,
+    read_options: pacsv.ReadOptions,
+    parse_options: pacsv.ParseOptions,
+) -> dict[str, pa.DataType]:
+    """Infer a fixed Arrow schema from the first block of the file.
+
+    Mirrors the types Polars used to infer: date, time and timestamp columns
+    stay as text, and columns with no value in the sample are text rather than
+    ``null`` (which would reject the first real value in a later block).
+    """
+    sample = head
+    if not at_eof:
+        # Drop the trailing partial row; the sample must parse on its own
+        last_newline = head.rfind(b"\n")
+        if last_newline >= 0:
+            sample = head[: last_newline + 1]
+
+    table = pacsv.read_csv(
+        pa.py_buffer(sample),
+        read_options=read_options,
+        parse_options=parse_options,
+        convert_options=_convert_options(),
+    )
+
+    column_types = {}
+    for field in table.schema:
+        dtype = field.type
+        if (
+            pa.types.is_null(dtype)
+            or pa.types.is_date(dtype)
+            or pa.types.is_time(dtype)
+            or pa.types.is_timestamp(dtype)
+        ):
+            dtype = pa.utf8()
+        column_types[field.name] = dtype
+    return column_types
+
+
+def _match_rule_types(
+    rule_types: dict[str, pa.DataType],
+    column_types: dict[str, pa.DataType],
+    autogenerate_names: bool,
+) -> dict[str, tuple[str, pa.DataType]]:
+    """Key reglas by the reader's column names, dropping unknown columns.
+
+    Headerless files are stored with Polars-style ``column_N`` names, but Arrow
+    reads them as ``f{N-1}``. Returns ``{rule name: (reader name, type)}``.
+    """
+    matched = {}
+    for rule_name, dtype in rule_types.items():
+        name = rule_name
+        suffix = rule_name.removeprefix("column_")
+        if autogenerate_names and suffix != rule_name and suffix.isdecimal():
+            name = f"f{int(suffix) - 1}"
+        if name in column_types:
+            matched[rule_name] = (name, dtype)
+    return matched
+
+
+def _lenient_cast(name: str, dtype: pl.DataType) -> pl.Expr:
+    """Cast a text column to ``dtype``, turning unparsable values into null."""
+    col = pl.col(name)
+    if dtype == pl.Boolean:
+        # Polars cannot cast strings to Boolean; use Arrow's true/false values
+        lowered = col.str.to_lowercase()
+        return (
+            pl.when(lowered.is_in(["true", "1"]))
+            .then(True)
+            .when(lowered.is_in(["false", "0"]))
+            .then(False)
+            .otherwise(None)
+            .alias(name)
+        )
+    if dtype == pl.Datetime:
+        return col.str.to_datetime(time_unit=dtype.time_unit, strict=False)
+    return col.cast(dtype, strict=False)
+
+
+def _encode_docs(docs: list[dict]) -> list[RawBSONDocument]:
+    """Pre-encode documents to raw BSON with the C encoder.
+
+    PyMongo sends RawBSONDocument bytes as-is and, unlike plain dicts, does not
+    generate a client-side ObjectId per document; the server assigns ``_id``.
+    """
+    return list(map(RawBSONDocument, map(bson.encode, docs)))
+
+
+# pandas dtype string (lowercased) -> Arrow type, used for reglas
+_PANDAS_TO_ARROW: dict[str, pa.DataType] = {
+    "str": pa.utf8(),
+    "string": pa.utf8(),
+    "object": pa.utf8(),
+    "int": pa.int64(),
+    "int64": pa.int64(),
+    "int32": pa.int32(),
+    "int16": pa.int16(),
+    "int8": pa.int8(),
+    "float": pa.float64(),
+    "float64": pa.float64(),
+    "float32": pa.float32(),
+    "bool": pa.bool_(),
+    "boolean": pa.bool_(),
+    "datetime64": pa.timestamp("ms"),
+    "datetime64[ns]": pa.timestamp("ns"),
+}
+
+
+def _convert_pandas_dtypes_to_arrow(
+    pandas_dtypes: dict[str, str],
+) -> dict[str, pa.DataType]:
+    """Convert pandas dtype strings to Arrow data types.
+
+    Handles common pandas dtype specifications (case-insensitive):
+    - 'str', 'object' -> pa.utf8()
+    - 'int', 'int64', 'Int64' -> pa.int64()
+    - 'int32', 'Int32' -> pa.int32()
+    - 'float', 'float64' -> pa.float64()
+    - 'float32' -> pa.float32()
+    - 'bool' -> pa.bool_()
+    - 'datetime64[ns]' -> pa.timestamp("ns")
+    """
+    return {
+        col: _PANDAS_TO_ARROW[key]
+        for col, dtype_str in pandas_dtypes.items()
+        if (key := dtype_str.lower().strip()) in _PANDAS_TO_ARROW
+    }
@@ -5,7 +5,7 @@ import traceback
 from typing import Callable
 
 from config.settings import Settings
-from models.jobs import JobResponse
+from models.jobs import JobConfig, JobResponse
 from services.api import ApiClient
 from services.db import process_csv_stream_to_mongo, ProcessingState
 from services.storage import stream_blob
@@ -13,33 +13,62 @@ from services.storage import stream_blob
 Logger = Callable[[str], None]
 
 
-def start_heartbeat(
-    client: ApiClient,
-    job_id: str,
-    interval: int,
-    log: Logger,
-    processing_state: ProcessingState | None = None,
-) -> tuple[threading.Thread, threading.Event]:
-    stop_event = threading.Event()
-    thread = threading.Thread(
-        target=_heartbeat_loop,
-        args=(client, job_id, stop_event, interval, log, processing_state),
-        daemon=True,
-    )
-    thread.start()
-    return thread, stop_event
-
-
-def _heartbeat_loop(
-    client: ApiClient,
-    job_id: str,
-    stop_event: threading.Event,
-    interval: int,
-    log: Logger,
-    processing_state: ProcessingState | None = None,
-):
-    """Periodically ping the API to update heartbeat with rows processed delta."""
-    while not stop_event.is_set():
+class HeartbeatManager:
+    """Single long-lived heartbeat thread shared by every job of the worker.
+
+    The current job is a lock-protected slot: ``set_job`` starts reporting for
+    a job (sending a heartbeat right away) and ``clear_job`` pauses reporting
+    until the next one. Ticks with no current job skip the HTTP call.
+    """
+
+    def __init__(self, client: ApiClient, interval: int, log: Logger):
+        self.client = client
+        self.interval = interval
+        self.log = log
+        self._lock = threading.Lock()
+        self._current_job_id: str | None = None
+        self._processing_state: ProcessingState | None = None
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self, timeout: float = 5) -> None:
+        """Stop the thread without waiting for the current interval to elapse."""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=timeout)
+
+    def set_job(
+        self, job_id: str, processing_state: ProcessingState | None = None
+    ) -> None:
+        with self._lock:
+            self._current_job_id = job_id
+            self._processing_state = processing_state
+        self._wake_event.set()
+
+    def clear_job(self) -> None:
+        with self._lock:
+            self._current_job_id = None
+            self._processing_state = None
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self._wake_event.clear()
+            with self._lock:
+                job_id = self._current_job_id
+                processing_state = self._processing_state
+            if job_id is not None:
+                self._send_heartbeat(job_id, processing_state)
+            self._wake_event.wait(self.interval)
+
+    def _send_heartbeat(
+        self, job_id: str, processing_state: ProcessingState | None
+    ) -> None:
+        """Ping the API to update heartbeat with rows processed delta."""
         try:
             # Get delta of rows processed since last heartbeat
             rows_delta = 0
@@ -48,25 +77,70 @@ def _heartbeat_loop(
 
             # Send heartbeat as POST with rows_delta in body
             data = {"rows_delta": rows_delta}
-            resp = client.post(f"/jobs/{job_id}/heartbeat", data=data)
+            resp = self.client.post(
+                f"/jobs/{job_id}/heartbeat", data=data, raise_for_status=False
+            )
             if resp.status_code != 200:
-                log(f"Heartbeat failed: {resp.status_code} {resp.text}")
+                self.log(f"Heartbeat failed: {resp.status_code} {resp.text}")
         except Exception as e:
-            log(f"Heartbeat error: {e}")
-        stop_event.wait(interval)
+            self.log(f"Heartbeat error: {e}")
+
 
+def get_next_job(
+    client: ApiClient, log: Logger, wait_seconds: int = 55
+) -> JobResponse | None:
+    """Long-poll the backend for the next job.
 
-def get_next_job(client: ApiClient, log: Logger) -> JobResponse | None:
+    The server may hold the request up to ``wait_seconds`` until a job is
+    available; backends without long-poll support simply answer right away.
+    """
     try:
-        resp = client.get("/jobs/next")
+        resp = client.get(
+            "/jobs/next",
+            params={"wait": wait_seconds},
+            timeout=wait_seconds + 5,
+            # A gateway timeout here already cost a full long-poll; just re-poll
+            retry=False,
+        )
         if resp.status_code == 204:
             return None
-        return JobResponse.model_validate(resp.json())
+        return _build_job(resp.json())
     except Exception as e:
         log(f"Error fetching next job: {e}")
         return None
 
 
+# Top-level job fields and the exact types that are safe to trust as-is,
+# derived from the model so new fields are always checked. Non-class
+# annotations (e.g. ``str | None``) never match, forcing full validation.
+_JOB_FIELD_TYPES = {
+    name: field.annotation
+    for name, field in JobResponse.model_fields.items()
+    if name != "config"
+}
+
+
+def _build_job(payload: dict) -> JobResponse:
+    """Build a JobResponse from a backend payload, skipping validation if safe.
+
+    When every top-level field is present with its exact type, the model is
+    constructed without validation and only the small nested config is
+    validated (coercing e.g. ``skiprows="1"``). Anything else goes through full
+    validation, which coerces or raises.
+    """
+    if (
+        isinstance(payload, dict)
+        and all(
+            type(payload.get(name)) is expected
+            for name, expected in _JOB_FIELD_TYPES.items()
+        )
+        and isinstance(payload.get("config"), dict)
+    ):
+        config = JobConfig.model_validate(payload["config"])
+        return JobResponse.model_construct(**{**payload, "config": config})
+    return JobResponse.model_validate(payload)
+
+
 def mark_complete(
     client: ApiClient,
     job_id: str,
@@ -79,6 +153,7 @@ def mark_complete(
             f"/jobs/{job_id}/complete",
             params=params,
             timeout=20,
+            raise_for_status=False,
         )
         if resp.status_code != 200:
             log(f"Complete call failed: {resp.status_code} {resp.text}")
@@ -100,6 +175,7 @@ def process_job(
             settings.azure_storage_connection_string,
             job.file_path,
             log,
+            block_size_bytes=settings.block_size_bytes,
         )
 
         process_csv_stream_to_mongo(
@@ -1,12 +1,21 @@
-from typing import Callable
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Iterator
 from urllib.parse import urlparse
 
-from azure.storage.blob import BlobServiceClient
+from azure.core import MatchConditions
+from azure.storage.blob import BlobClient, BlobServiceClient
 
 from models.file import ChunkStream
 
 Logger = Callable[[str], None]
 
+# The Azure SDK logs every request/chunk at INFO; keep only warnings
+for _name in ("azure.storage.blob", "azure.core.pipeline.policies.http_logging_policy"):
+    logging.getLogger(_name).setLevel(logging.WARNING)
+
 
 def parse_blob_components(file_url: str) -> tuple[str, str]:
     """Extract container and blob name from a full https blob URL."""
@@ -31,12 +40,79 @@ def parse_s3_url(s3_url: str) -> tuple[str, str]:
     return bucket, key
 
 
-def stream_blob(connection_string: str, file_url: str, log: Logger | None = None):
-    """Return a streaming file-like object over the blob (no temp file)."""
+@lru_cache(maxsize=4)
+def _bsc(connection_string: str, max_single_get_size: int) -> BlobServiceClient:
+    """Return a BlobServiceClient reused across jobs for the same account.
+
+    Keeps the parsed credential, HTTP pipeline and transport alive instead of
+    rebuilding them for every job.
+    """
+    return BlobServiceClient.from_connection_string(
+        connection_string,
+        max_single_get_size=max_single_get_size,
+        connection_timeout=30,
+        read_timeout=300,
+    )
+
+
+def _iter_blob_ranges(
+    blob_client: BlobClient,
+    chunk_size: int,
+    max_concurrency: int,
+) -> Iterator[bytes]:
+    """Download the blob as ``chunk_size`` ranges in parallel, yielding in order.
+
+    Up to ``max_concurrency`` ranges are in flight ahead of the consumer, so
+    memory is bounded to that many chunks. Every range is pinned to the etag
+    seen at start, so a blob overwritten mid-read fails instead of mixing
+    versions.
+    """
+    props = blob_client.get_blob_properties()
+    offsets = iter(range(0, props.size, chunk_size))
+
+    def fetch(offset: int) -> bytes:
+        return blob_client.download_blob(
+            offset=offset,
+            length=min(chunk_size, props.size - offset),
+            etag=props.etag,
+            match_condition=MatchConditions.IfNotModified,
+        ).readall()
+
+    pool = ThreadPoolExecutor(max_workers=max_concurrency)
+    try:
+        pending = deque(
+            pool.submit(fetch, offset)
+            for _, offset in zip(range(max_concurrency), offsets)
+        )
+        while pending:
+            data = pending.popleft().result()
+            offset = next(offsets, None)
+            if offset is not None:
+                pending.append(pool.submit(fetch, offset))
+            yield data
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def stream_blob(
+    connection_string: str,
+    file_url: str,
+    log: Logger | None = None,
+    block_size_bytes: int = 16 * 1024 * 1024,
+    max_concurrency: int = 8,
+):
+    """Return a streaming file-like object over the blob (no temp file).
+
+    The blob is fetched as ``block_size_bytes`` range GETs, ``max_concurrency``
+    at a time, so downloads run ahead of CSV parsing and each reader block
+    maps to a single HTTP request.
+    """
     container, blob_name = parse_blob_components(file_url)
-    bsc = BlobServiceClient.from_connection_string(connection_string)
-    blob_client = bsc.get_blob_client(container=container, blob=blob_name)
-    downloader = blob_client.download_blob(max_concurrency=4)
+    blob_client = _bsc(connection_string, block_size_bytes).get_blob_client(
+        container=container, blob=blob_name
+    )
     if log:
         log(f"Streaming blob '{container}/{blob_name}'")
-    return ChunkStream(downloader.chunks())
+    return ChunkStream(
+        _iter_blob_ranges(blob_client, block_size_bytes, max_concurrency)
+    )
@@ -0,0 +1,89 @@
+import httpx
+import pytest
+
+from services import api
+from services.api import ApiClient
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(api.time, "sleep", lambda seconds: None)
+
+
+def _client(handler) -> ApiClient:
+    return ApiClient(
+        "http://backend:8000",
+        "secret",
+        "worker-1",
+        client=httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+
+def test_injected_client_gets_base_url_and_default_headers():
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, json={})
+
+    _client(handler).get("/jobs/next")
+
+    assert str(seen[0].url) == "http://backend:8000/jobs/next"
+    assert seen[0].headers["X-API-Secret"] == "secret"
+    assert seen[0].headers["X-Worker-Id"] == "worker-1"
+
+
+def test_gateway_errors_are_retried():
+    statuses = iter([503, 502, 200])
+
+    resp = _client(lambda request: httpx.Response(next(statuses))).get("/jobs/next")
+
+    assert resp.status_code == 200
+
+
+def test_gateway_errors_raise_after_retries():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(504)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        _client(handler).get("/jobs/next")
+    assert len(calls) == 3
+
+
+def test_post_is_not_retried():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(504)
+
+    resp = _client(handler).post("/jobs/1/heartbeat", raise_for_status=False)
+
+    assert resp.status_code == 504
+    assert len(calls) == 1
+
+
+def test_retry_can_be_disabled():
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(504)
+
+    _client(handler).get("/jobs/next", retry=False, raise_for_status=False)
+
+    assert len(calls) == 1
+
+
+def test_redirects_are_followed():
+    def handler(request):
+        if request.url.path == "/jobs/next":
+            return httpx.Response(307, headers={"Location": "/v2/jobs/next"})
+        return httpx.Response(200, json={"path": request.url.path})
+
+    resp = _client(handler).get("/jobs/next")
+
+    assert resp.json() == {"path": "/v2/jobs/next"}
@@ -0,0 +1,131 @@
+import bson
+import pytest
+
+from models.file import ChunkStream
+from models.jobs import JobConfig
+from services import db
+
+
+class FakeCollection:
+    def __init__(self):
+        self.docs = []
+
+    def insert_many(self, docs, **kwargs):
+        self.docs.extend(bson.decode(doc.raw) for doc in docs)
+
+
+class FakeDatabase:
+    def __init__(self, collection):
+        self.collection = collection
+
+    def get_collection(self, name, **kwargs):
+        return self.collection
+
+
+class FakeClient:
+    def __init__(self, collection):
+        self.collection = collection
+
+    def __getitem__(self, name):
+        return FakeDatabase(self.collection)
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    fake = FakeCollection()
+    monkeypatch.setattr(db, "_get_mongo_client", lambda uri: FakeClient(fake))
+    return fake
+
+
+def _load(data: bytes, chunk: int = 7, **kwargs) -> None:
+    """Stream ``data`` in short ``chunk``-byte reads, like Azure chunks."""
+    chunks = [data[i : i + chunk] for i in range(0, len(data), chunk)]
+    db.process_csv_stream_to_mongo(
+        ChunkStream(chunks), "mongodb://localhost/test", "test", "rows", **kwargs
+    )
+
+
+def test_numbers_are_inferred(collection):
+    _load(b"a,b\n1,1.5\n2,2.5\n")
+
+    assert collection.docs == [{"a": 1, "b": 1.5}, {"a": 2, "b": 2.5}]
+
+
+def test_dates_and_times_stay_strings(collection):
+    _load(b"d,t\n2024-01-31,10:00:00\n2024-02-01,11:30:00\n")
+
+    assert collection.docs == [
+        {"d": "2024-01-31", "t": "10:00:00"},
+        {"d": "2024-02-01", "t": "11:30:00"},
+    ]
+
+
+def test_timestamps_stay_strings(collection):
+    _load(b"ts\n2024-01-31 10:00:00\n2024-01-31T11:00:00\n")
+
+    assert collection.docs == [
+        {"ts": "2024-01-31 10:00:00"},
+        {"ts": "2024-01-31T11:00:00"},
+    ]
+
+
+def test_empty_fields_are_null(collection):
+    _load(b"a,s\n1,\n2,x\n")
+
+    assert collection.docs == [{"a": 1, "s": None}, {"a": 2, "s": "x"}]
+
+
+def test_column_empty_in_first_block_accepts_later_values(collection):
+    rows = b"".join(b"%d,\n" % i for i in range(20)) + b"20,hello\n"
+
+    _load(b"a,s\n" + rows, block_size_bytes=32)
+
+    assert len(collection.docs) == 21
+    assert collection.docs[0] == {"a": 0, "s": None}
+    assert collection.docs[-1] == {"a": 20, "s": "hello"}
+
+
+def test_invalid_values_fail_in_strict_mode(collection):
+    with pytest.raises(Exception, match="Error during CSV processing"):
+        _load(b"a\n1\nxyz\n", config=JobConfig(reglas={"a": "int64"}))
+
+
+def test_invalid_values_become_null_when_ignoring_errors(collection):
+    config = JobConfig(reglas={"a": "int64", "b": "bool"}, merror="ignore")
+
+    _load(b"a,b\n1,true\nxyz,maybe\n", config=config)
+
+    assert collection.docs == [{"a": 1, "b": True}, {"a": None, "b": None}]
+
+
+def test_rules_apply_to_headerless_columns(collection):
+    config = JobConfig(skiprows=1, reglas={"column_1": "str"})
+
+    _load(b"h1,h2\n001,2\n", config=config)
+
+    assert collection.docs == [{"column_1": "001", "column_2": 2}]
+
+
+@pytest.mark.parametrize("merror", ["strict", "ignore"])
+def test_rules_for_unknown_columns_are_ignored(collection, merror):
+    config = JobConfig(reglas={"a": "str", "zzz": "int64"}, merror=merror)
+
+    _load(b"a,b\n001,2\n", config=config)
+
+    assert collection.docs == [{"a": "001", "b": 2}]
+
+
+def test_metadata_columns(collection):
+    _load(b"a\n1\n", client_id=7, period="202401")
+
+    assert collection.docs == [{"a": 1, "ctr": 7, "crx": 202401}]
+
+
+@pytest.mark.parametrize(
+    "period, expected",
+    [("202401", 202401), (" 202401", 202401), ("+5", 5), ("-3", -3), ("²", "²")],
+)
+def test_period_is_int_when_parseable(collection, period, expected):
+    _load(b"a\n1\n", period=period)
+
+    assert collection.docs[0]["crx"] == expected
@@ -0,0 +1,146 @@
+import threading
+import time
+
+import pytest
+from pydantic import ValidationError
+
+from models.jobs import JobResponse
+from services.db import ProcessingState
+from services.jobs import (
+    _JOB_FIELD_TYPES,
+    HeartbeatManager,
+    _build_job,
+    get_next_job,
+)
+
+PAYLOAD = {
+    "id": "job-1",
+    "file_path": "https://acct.blob.core.windows.net/data/file.csv",
+    "collection_name": "rows",
+    "client_id": 7,
+    "period": "202401",
+    "config": {"delimitador": ";", "skiprows": "1"},
+}
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+class FakeApiClient:
+    def __init__(self, payload):
+        self.payload = payload
+
+    def get(self, path, **kwargs):
+        return FakeResponse(self.payload)
+
+
+def test_trusted_field_types_cover_the_model():
+    assert set(_JOB_FIELD_TYPES) == set(JobResponse.model_fields) - {"config"}
+    assert _JOB_FIELD_TYPES["client_id"] is int
+
+
+def test_build_job_validates_nested_config():
+    job = _build_job(PAYLOAD)
+
+    assert job.id == "job-1"
+    assert job.config.delimitador == ";"
+    assert job.config.skiprows == 1
+
+
+def test_build_job_coerces_mistyped_fields():
+    job = _build_job({**PAYLOAD, "client_id": "7"})
+
+    assert job.client_id == 7
+
+
+def test_build_job_rejects_numeric_period():
+    with pytest.raises(ValidationError):
+        _build_job({**PAYLOAD, "period": 202401})
+
+
+def test_build_job_rejects_missing_fields():
+    with pytest.raises(ValidationError):
+        _build_job({"file_path": "x"})
+
+
+def test_get_next_job_returns_none_for_invalid_payload():
+    logged = []
+
+    assert get_next_job(FakeApiClient({"file_path": "x"}), logged.append) is None
+    assert logged and logged[0].startswith("Error fetching next job")
+
+
+class FakeHeartbeatClient:
+    def __init__(self):
+        self.calls = []
+        self.called = threading.Event()
+
+    def post(self, path, **kwargs):
+        self.calls.append((path, kwargs["data"]))
+        self.called.set()
+        return FakeResponse(None)
+
+
+@pytest.fixture
+def heartbeat_client():
+    return FakeHeartbeatClient()
+
+
+def _manager(client, interval):
+    manager = HeartbeatManager(client, interval, log=lambda msg: None)
+    manager.start()
+    return manager
+
+
+def test_set_job_sends_heartbeat_immediately(heartbeat_client):
+    manager = _manager(heartbeat_client, interval=30)
+    state = ProcessingState()
+    state.add_rows(5)
+    try:
+        manager.set_job("job-1", state)
+
+        assert heartbeat_client.called.wait(timeout=2)
+        assert heartbeat_client.calls == [
+            ("/jobs/job-1/heartbeat", {"rows_delta": 5})
+        ]
+    finally:
+        manager.stop()
+
+
+def test_tick_without_job_makes_no_call(heartbeat_client):
+    manager = _manager(heartbeat_client, interval=0.01)
+    time.sleep(0.1)
+    manager.stop()
+
+    assert heartbeat_client.calls == []
+
+
+def test_clear_job_stops_reporting(heartbeat_client):
+    manager = _manager(heartbeat_client, interval=0.01)
+    try:
+        manager.set_job("job-1")
+        assert heartbeat_client.called.wait(timeout=2)
+        manager.clear_job()
+        time.sleep(0.05)  # Let a tick already past the job check finish
+        calls_after_clear = len(heartbeat_client.calls)
+        time.sleep(0.1)
+
+        assert len(heartbeat_client.calls) == calls_after_clear
+    finally:
+        manager.stop()
+
+
+def test_stop_does_not_wait_for_interval(heartbeat_client):
+    manager = _manager(heartbeat_client, interval=30)
+    started = time.monotonic()
+    manager.stop()
+
+    assert time.monotonic() - started < 1
+    assert not manager._thread.is_alive()
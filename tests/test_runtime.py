@@ -0,0 +1,35 @@
+import os
+import subprocess
+import sys
+
+
+def _run(code: str, **env: str) -> str:
+    environ = {k: v for k, v in os.environ.items() if k != "POLARS_MAX_THREADS"}
+    environ.update(env)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+        env=environ,
+    )
+    return result.stdout.strip()
+
+
+def test_importing_db_caps_polars_threads():
+    out = _run(
+        "import os, services.db, polars; "
+        "print(os.environ['POLARS_MAX_THREADS'], polars.thread_pool_size())"
+    )
+
+    expected = len(os.sched_getaffinity(0))
+    assert out == f"{expected} {expected}"
+
+
+def test_explicit_polars_max_threads_wins():
+    out = _run(
+        "import services.db, polars; print(polars.thread_pool_size())",
+        POLARS_MAX_THREADS="3",
+    )
+
+    assert out == "3"
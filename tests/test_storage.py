@@ -0,0 +1,43 @@
+import threading
+from types import SimpleNamespace
+
+from services.storage import _iter_blob_ranges
+
+
+class FakeDownloader:
+    def __init__(self, data):
+        self.data = data
+
+    def readall(self):
+        return self.data
+
+
+class FakeBlobClient:
+    def __init__(self, data):
+        self.data = data
+        self.ranges = []
+        self.lock = threading.Lock()
+
+    def get_blob_properties(self):
+        return SimpleNamespace(size=len(self.data), etag="etag-1")
+
+    def download_blob(self, offset, length, etag, match_condition):
+        assert etag == "etag-1"
+        with self.lock:
+            self.ranges.append((offset, length))
+        return FakeDownloader(self.data[offset : offset + length])
+
+
+def test_ranges_are_yielded_in_order():
+    blob = FakeBlobClient(bytes(range(256)) * 4)
+
+    chunks = list(_iter_blob_ranges(blob, chunk_size=100, max_concurrency=3))
+
+    assert b"".join(chunks) == blob.data
+    assert [len(c) for c in chunks] == [100] * 10 + [24]
+    expected = [(offset, min(100, 1024 - offset)) for offset in range(0, 1024, 100)]
+    assert sorted(blob.ranges) == expected
+
+
+def test_empty_blob_yields_nothing():
+    assert list(_iter_blob_ranges(FakeBlobClient(b""), 100, 4)) == []